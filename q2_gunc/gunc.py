@@ -5,7 +5,6 @@
 #
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
-import glob
 import json
 import logging
 import os
@@ -17,7 +16,6 @@ from importlib import resources
 from pathlib import Path
 from typing import Union
 
-import cssutils
 import pandas as pd
 import q2templates
 from q2_types.feature_data_mag import MAGSequencesDirFmt
@@ -33,6 +31,17 @@ EXTERNAL_CMD_WARNING = (
     "cannot be manually re-run as they will depend on "
     "temporary files that no longer exist."
 )
+SUMMARY_COLUMNS = [
+    "genome",
+    "taxonomic_level",
+    "reference_representation_score",
+    "contamination_portion",
+    "pass.GUNC",
+    "n_contigs",
+    "n_genes_mapped",
+    "clade_separation_score",
+    "genes_retained_index",
+]
 
 
 def run_command(cmd, env=None, verbose=True, **kwargs):
@@ -52,9 +61,8 @@ def run_command(cmd, env=None, verbose=True, **kwargs):
         Additional arguments to subprocess.run.
     """
     if verbose:
-        print(EXTERNAL_CMD_WARNING)
-        print("\nCommand:", end=" ")
-        print(" ".join(cmd), end="\n\n")
+        # a single write keeps messages from concurrent workers intact
+        print(f"{EXTERNAL_CMD_WARNING}\n\nCommand: {' '.join(cmd)}\n\n", end="")
 
     if env:
         subprocess.run(cmd, env=env, check=True, **kwargs)
@@ -90,14 +98,21 @@ def _run_gunc_plot(result_file: str, plots_dir: str) -> None:
     run_command(cmd, verbose=True)
 
 
-def _generate_plots(results: GUNCResultsDirectoryFormat, sample_id: str = ""):
+def _generate_plots(
+    results: GUNCResultsDirectoryFormat, sample_id: str = "", threads: int = 1
+):
     """Generate GUNC plots for all result files in the results directory."""
 
     diamond_outputs = (Path(results.path) / sample_id / "diamond_output").glob("*")
     plots_dir = Path(results.path) / sample_id / "plots"
     os.makedirs(plots_dir, exist_ok=True)
-    for result_file in diamond_outputs:
-        _run_gunc_plot(str(result_file), str(plots_dir))
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [
+            executor.submit(_run_gunc_plot, str(result_file), str(plots_dir))
+            for result_file in diamond_outputs
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
 def _run_gunc(
@@ -111,7 +126,17 @@ def _run_gunc(
     """Run GUNC on the provided MAGs."""
 
     results = GUNCResultsDirectoryFormat()
-    db_fp = glob.glob(f"{db.path}/*.dmnd")[0]
+    with os.scandir(db.path) as entries:
+        db_fp = next(
+            (
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".dmnd") and entry.is_file()
+            ),
+            None,
+        )
+    if db_fp is None:
+        raise ValueError(f"No GUNC database (.dmnd) file found in {db.path}.")
 
     base_cmd = [
         "gunc",
@@ -144,7 +169,7 @@ def _run_gunc(
                 ]
             )
             run_command(cmd, verbose=True)
-            _generate_plots(results, sample_id)
+            _generate_plots(results, sample_id, threads=threads)
     else:
         base_cmd.extend(
             [
@@ -155,7 +180,7 @@ def _run_gunc(
             ]
         )
         run_command(base_cmd, verbose=True)
-        _generate_plots(results)
+        _generate_plots(results, threads=threads)
 
     return results
 
@@ -165,6 +190,8 @@ def _cleanup_normalize_css(css_file_path):
     Removes the [type="checkbox"], [type="radio"] { ... }
     block from the CSS file using cssutils.
     """
+    import cssutils
+
     cssutils.log.setLevel(logging.CRITICAL)
     sheet = cssutils.parseFile(css_file_path)
     rules_to_remove = []
@@ -186,24 +213,18 @@ def _process_sample(
     summary_data, sample_mags = [], []
     summary_files = list(Path(sample_path).glob("gunc_output/*.all_levels.tsv"))
     for sf in summary_files:
-        df = pd.read_csv(sf, sep="\t")
-        for _, row in df.iterrows():
-            summary_data.append(
-                {
-                    "sample_id": sample_id,
-                    "mag_id": row["genome"],
-                    "taxonomic_level": row["taxonomic_level"],
-                    "reference_representation_score": row[
-                        "reference_representation_score"
-                    ],
-                    "contamination_portion": row["contamination_portion"],
-                    "pass_gunc": bool(row["pass.GUNC"]),
-                    "n_contigs": row["n_contigs"],
-                    "n_genes_mapped": row["n_genes_mapped"],
-                    "clade_separation_score": row["clade_separation_score"],
-                    "genes_retained_index": row["genes_retained_index"],
-                }
-            )
+        df = pd.read_csv(
+            sf,
+            sep="\t",
+            engine="c",
+            memory_map=True,
+            low_memory=False,
+            usecols=SUMMARY_COLUMNS,
+        )[SUMMARY_COLUMNS]
+        df = df.rename(columns={"genome": "mag_id", "pass.GUNC": "pass_gunc"})
+        df["pass_gunc"] = df["pass_gunc"].astype(bool)
+        df.insert(0, "sample_id", sample_id)
+        summary_data.extend(df.to_dict(orient="records"))
 
     diamond_outputs = Path(sample_path) / "diamond_output"
     plots = Path(sample_path) / "plots"
@@ -8,6 +8,7 @@
 import json
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, ANY, call
@@ -46,6 +47,16 @@ class TestGUNC(TestPluginBase):
         run_command(["echo", "hi"], verbose=False)
         subp_run.assert_called_once_with(["echo", "hi"], check=True)
 
+    @patch("builtins.print")
+    @patch("subprocess.run")
+    def test_run_command_verbose_single_write(self, subp_run, mock_print):
+        from q2_gunc.gunc import run_command, EXTERNAL_CMD_WARNING
+
+        run_command(["echo", "hi"], verbose=True)
+        mock_print.assert_called_once_with(
+            f"{EXTERNAL_CMD_WARNING}\n\nCommand: echo hi\n\n", end=""
+        )
+
     @patch("subprocess.run")
     def test_run_command_env(self, subp_run):
         from q2_gunc.gunc import run_command
@@ -114,6 +125,19 @@ class TestGUNC(TestPluginBase):
             any_order=True,
         )
 
+    @patch("os.makedirs")
+    @patch("q2_gunc.gunc._run_gunc_plot")
+    def test_generate_plots_threads_error(self, mock_run_plot, mock_makedirs):
+        results = GUNCResultsDirectoryFormat(self.get_data_path("results"), mode="r")
+
+        def _fail_one(result_file, plots_dir):
+            if "1da59757" in result_file:
+                raise subprocess.CalledProcessError(1, ["gunc", "plot"])
+
+        mock_run_plot.side_effect = _fail_one
+        with self.assertRaises(subprocess.CalledProcessError):
+            _generate_plots(results, threads=2)
+
     @patch("q2_gunc.gunc._generate_plots")
     @patch("q2_gunc.gunc.run_command")
     def test_run_gunc_sample_data(self, mock_run_cmd, mock_plots):
@@ -166,7 +190,10 @@ class TestGUNC(TestPluginBase):
         ]
         mock_run_cmd.assert_has_calls(exp_calls, any_order=True)
 
-        exp_plots_calls = [call(obs, "sample1"), call(obs, "sample2")]
+        exp_plots_calls = [
+            call(obs, "sample1", threads=4),
+            call(obs, "sample2", threads=4),
+        ]
         mock_plots.assert_has_calls(exp_plots_calls, any_order=True)
 
         self.assertIsInstance(obs, GUNCResultsDirectoryFormat)
@@ -196,9 +223,16 @@ class TestGUNC(TestPluginBase):
             ],
             verbose=True,
         )
-        mock_plots.assert_called_with(obs)
+        mock_plots.assert_called_with(obs, threads=4)
         self.assertIsInstance(obs, GUNCResultsDirectoryFormat)
 
+    @patch("q2_gunc.gunc.run_command")
+    def test_run_gunc_no_db_file(self, mock_run_cmd):
+        db = GUNCDatabaseDirFmt(self.temp_dir.name, mode="r")
+        with self.assertRaisesRegex(ValueError, "No GUNC database"):
+            _run_gunc(mags=self.mags, db=db)
+        mock_run_cmd.assert_not_called()
+
     @patch("q2_gunc.gunc.run_command")
     @patch("os.makedirs")
     def test_run_gunc_plot(self, mock_makedirs, mock_run_cmd):
@@ -250,6 +284,32 @@ class TestGUNC(TestPluginBase):
             ],
         )
         self.assertEqual(len(obs_summary), 14)
+
+        exp_record = {
+            "sample_id": "SRR9640343",
+            "mag_id": "0c20367d-4775-43f1-90c6-1a36afc5e4da",
+            "taxonomic_level": "kingdom",
+            "reference_representation_score": 0.97,
+            "contamination_portion": 0.0,
+            "pass_gunc": True,
+            "n_contigs": 338,
+            "n_genes_mapped": 1610,
+            "clade_separation_score": 0,
+            "genes_retained_index": 0.98,
+        }
+        obs_record = next(
+            r
+            for r in obs_summary
+            if r["mag_id"] == exp_record["mag_id"]
+            and r["taxonomic_level"] == "kingdom"
+        )
+        self.assertDictEqual(obs_record, exp_record)
+        self.assertListEqual(list(obs_record), list(exp_record))
+        for record in obs_summary:
+            for value in record.values():
+                self.assertIn(type(value), (str, int, float, bool))
+            self.assertIs(type(record["pass_gunc"]), bool)
+        self.assertEqual(json.loads(json.dumps(obs_summary)), obs_summary)
         mock_copy.assert_has_calls(
             [
                 call(
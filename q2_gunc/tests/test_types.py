@@ -6,6 +6,7 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 import os
+from unittest.mock import patch
 
 import pytest
 from q2_types.reference_db import ReferenceDB
@@ -48,11 +49,28 @@ class TestTypes(TestPluginBase):
         with pytest.raises(ValidationError):
             fmt.validate()
 
+    @patch("json.load")
+    def test_guncgenecountsformat_not_json(self, mock_load):
+        f = self.get_data_path("valid_gunc.tsv")
+        fmt = GUNCGeneCountsFormat(f, mode="r")
+        with pytest.raises(ValidationError, match="not valid JSON"):
+            fmt.validate()
+        mock_load.assert_not_called()
+
     def test_gunchtmlplotformat_valid(self):
         f = self.get_data_path("valid_plot.html")
         fmt = GUNCHTMLPlotFormat(f, mode="r")
         fmt.validate()
 
+    def test_gunchtmlplotformat_valid_with_bom(self):
+        f = os.path.join(self.temp_dir.name, "bom_plot.html")
+        with open(self.get_data_path("valid_plot.html"), "rb") as src:
+            content = src.read()
+        with open(f, "wb") as dst:
+            dst.write(b"\xef\xbb\xbf" + content)
+        fmt = GUNCHTMLPlotFormat(f, mode="r")
+        fmt.validate()
+
     def test_gunchtmlplotformat_invalid(self):
         f = self.get_data_path("invalid_plot.html")
         fmt = GUNCHTMLPlotFormat(f, mode="r")
@@ -62,6 +80,12 @@ class TestTypes(TestPluginBase):
         except ValidationError:
             pass
 
+    def test_gunchtmlplotformat_not_html(self):
+        f = self.get_data_path("valid_gunc.tsv")
+        fmt = GUNCHTMLPlotFormat(f, mode="r")
+        with pytest.raises(ValidationError, match="missing <!DOCTYPE> or <html>"):
+            fmt.validate()
+
     def test_guncresultsdirectoryformat_no_samples(self):
         f = self.get_data_path("results")
         fmt = GUNCResultsDirectoryFormat(f, mode="r")
@@ -6,9 +6,10 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 import json
+import os
+import warnings
 
 import pandas as pd
-from bs4 import BeautifulSoup
 from q2_types.feature_data import ProteinFASTAFormat
 from q2_types.genome_data import OrthologFileFmt
 from q2_types.reference_db import DiamondDatabaseFileFmt
@@ -32,10 +33,11 @@ class GUNCResultsFormat(model.TextFileFormat):
         "reference_representation_score",
         "pass.GUNC",
     ]
+    _COLUMN_SET = frozenset(COLUMNS)
 
     def _validate_(self, level):
         df = pd.read_csv(str(self), sep="\t")
-        if not set(self.COLUMNS) == set(df.columns):
+        if self._COLUMN_SET != set(df.columns):
             raise ValidationError(
                 "GUNC results file does not contain expected columns."
             )
@@ -43,6 +45,11 @@ class GUNCResultsFormat(model.TextFileFormat):
 
 class GUNCGeneCountsFormat(model.TextFileFormat):
     def _validate_(self, level):
+        with open(str(self), "rb") as fh:
+            head = fh.read(1024).lstrip()
+        if not head.startswith((b"{", b"[")):
+            raise ValidationError("GUNC gene counts file is not valid JSON.")
+
         try:
             with open(str(self)) as fh:
                 json.load(fh)
@@ -52,10 +59,27 @@ class GUNCGeneCountsFormat(model.TextFileFormat):
 
 class GUNCHTMLPlotFormat(model.TextFileFormat):
     def _validate_(self, level):
+        with open(self.path, "rb") as file:
+            head = file.read(4096)
+        head = head.removeprefix(b"\xef\xbb\xbf").lstrip().lower()
+        if not head.startswith((b"<!doctype", b"<html", b"<!--", b"<?xml")):
+            raise ValidationError(
+                "GUNC HTML plot is not valid HTML: missing <!DOCTYPE> or <html> tag."
+            )
+
+        from bs4 import BeautifulSoup, FeatureNotFound
+
         try:
             with open(self.path, "r", encoding="utf-8") as file:
                 content = file.read()
-                BeautifulSoup(content, "html.parser")
+                try:
+                    BeautifulSoup(content, "lxml")
+                except FeatureNotFound:
+                    warnings.warn(
+                        "lxml is not installed; falling back to the slower "
+                        "html.parser to validate GUNC HTML plots."
+                    )
+                    BeautifulSoup(content, "html.parser")
         except Exception as e:
             raise ValidationError(f"GUNC HTML plot is not valid HTML: {e}")
 
@@ -101,13 +125,15 @@ class GUNCResultsDirectoryFormat(model.DirectoryFormat):
         return f"{prefix}plots/{mag_id}.viz.html"
 
     def file_dict(self):
-        subdir = self.path / "gunc_output"
-        if subdir.exists() and subdir.is_dir():
-            return {"": str(self.path)}
+        path = str(self.path)
+        if os.path.isdir(os.path.join(path, "gunc_output")):
+            return {"": path}
         else:
             sample_dict = {}
-            for sample_dir in self.path.iterdir():
-                sample_dict[sample_dir.name] = str(sample_dir)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        sample_dict[entry.name] = entry.path
             return sample_dict
 
 